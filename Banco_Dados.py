@@ -1,5 +1,69 @@
 import sqlite3
-from typing import List, Dict, Optional, Tuple, Any
+from contextlib import contextmanager
+from typing import Iterator, List, Dict, Optional, Tuple, Any
+
+# SQL dos métodos de consulta como constantes de módulo: a mesma string
+# (internada uma vez) mantém o cache de statements do sqlite3 quente,
+# evitando re-parse e re-planejamento a cada chamada.
+_SQL_MUSICA_BASE = '''
+    SELECT m.*, a.nome as artista_nome, g.nome as genero_nome
+    FROM musicas m
+    JOIN artistas a ON m.artista_id = a.id
+    JOIN generos g ON m.genero_id = g.id
+'''
+_SQL_MUSICA_POR_ID = _SQL_MUSICA_BASE + "WHERE m.id = ?"
+_SQL_MUSICA_POR_URL = _SQL_MUSICA_BASE + "WHERE m.url = ?"
+_SQL_MUSICAS_POR_ARTISTA = _SQL_MUSICA_BASE + \
+    "WHERE m.artista_id = ? ORDER BY m.titulo"
+_SQL_MUSICAS_POR_GENERO = _SQL_MUSICA_BASE + \
+    "WHERE m.genero_id = ? ORDER BY m.titulo"
+_SQL_TODAS_MUSICAS = _SQL_MUSICA_BASE + "ORDER BY a.nome, m.titulo"
+# Versão enxuta para listagem: sem url nem ids de junção, o SQLite
+# decodifica menos bytes por linha
+_SQL_TODAS_MUSICAS_RESUMO = '''
+    SELECT m.id, m.titulo, a.nome as artista_nome, g.nome as genero_nome
+    FROM musicas m
+    JOIN artistas a ON m.artista_id = a.id
+    JOIN generos g ON m.genero_id = g.id
+    ORDER BY a.nome, m.titulo
+'''
+_SQL_BUSCA_FTS = '''
+    SELECT m.*, a.nome as artista_nome, g.nome as genero_nome
+    FROM musicas_fts f
+    JOIN musicas m ON m.id = f.rowid
+    JOIN artistas a ON m.artista_id = a.id
+    JOIN generos g ON m.genero_id = g.id
+    WHERE musicas_fts MATCH ?
+    ORDER BY a.nome, m.titulo
+'''
+_SQL_BUSCA_LIKE = _SQL_MUSICA_BASE + \
+    "WHERE m.titulo LIKE ? OR a.nome LIKE ? ORDER BY a.nome, m.titulo"
+
+_SQL_ADD_ARTISTA = "INSERT INTO artistas (nome) VALUES (?)"
+_SQL_ADD_GENERO = "INSERT INTO generos (nome) VALUES (?)"
+# Upsert que devolve o id em uma única ida ao banco (SQLite 3.35+);
+# o DO UPDATE inócuo faz o RETURNING funcionar também no caso "já existe"
+_SQL_UPSERT_ARTISTA = '''
+    INSERT INTO artistas (nome) VALUES (?)
+    ON CONFLICT(nome) DO UPDATE SET nome = excluded.nome
+    RETURNING id
+'''
+_SQL_UPSERT_GENERO = '''
+    INSERT INTO generos (nome) VALUES (?)
+    ON CONFLICT(nome) DO UPDATE SET nome = excluded.nome
+    RETURNING id
+'''
+_TEM_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Lote máximo de parâmetros por consulta IN (abaixo do
+# SQLITE_MAX_VARIABLE_NUMBER histórico de 999)
+_MAX_VARIAVEIS = 900
+_SQL_ADD_MUSICA = '''
+    INSERT INTO musicas (artista_id, titulo, url, genero_id)
+    VALUES (?, ?, ?, ?)
+'''
+_SQL_TODOS_ARTISTAS = "SELECT * FROM artistas ORDER BY nome"
+_SQL_TODOS_GENEROS = "SELECT * FROM generos ORDER BY nome"
 
 
 class BancoDeDadosMusica:
@@ -17,15 +81,32 @@ class BancoDeDadosMusica:
         self.nome_banco = nome_banco
         self.conexao = None
         self.cursor = None
+        self._fts_disponivel = False
+        self._em_transacao = False
         self.conectar()
         self.criar_tabelas()
 
     def conectar(self) -> None:
-        """Conecta ao banco de dados SQLite."""
+        """Conecta ao banco de dados SQLite com PRAGMAs de desempenho."""
         try:
-            self.conexao = sqlite3.connect(self.nome_banco)
+            self.conexao = sqlite3.connect(
+                self.nome_banco, cached_statements=256)
             self.conexao.row_factory = sqlite3.Row  # Permite acessar colunas por nome
             self.cursor = self.conexao.cursor()
+            # Banco novo: páginas de 8KB, definidas antes que o modo WAL
+            # congele o page_size do arquivo
+            self.cursor.execute("SELECT COUNT(*) FROM sqlite_master")
+            if self.cursor.fetchone()[0] == 0:
+                self.cursor.execute("PRAGMA page_size=8192")
+                self.cursor.execute("VACUUM")
+            # WAL evita o fsync a cada commit e permite leituras concorrentes;
+            # com WAL, synchronous=NORMAL é seguro e bem mais rápido que FULL.
+            self.cursor.execute("PRAGMA journal_mode=WAL")
+            self.cursor.execute("PRAGMA synchronous=NORMAL")
+            self.cursor.execute("PRAGMA cache_size=-64000")  # ~64MB de cache de páginas
+            self.cursor.execute("PRAGMA mmap_size=536870912")  # 512MB via mmap
+            self.cursor.execute("PRAGMA temp_store=MEMORY")
+            self.cursor.execute("PRAGMA foreign_keys=ON")
             print(f"Conectado ao banco de dados: {self.nome_banco}")
         except sqlite3.Error as e:
             print(f"Erro ao conectar ao banco de dados: {e}")
@@ -63,6 +144,29 @@ class BancoDeDadosMusica:
                 )
             ''')
 
+            # Índices para as consultas quentes: filtro por artista/gênero
+            # já ordenado por título (evita varredura + ordenação em memória)
+            self.cursor.execute('''
+                CREATE INDEX IF NOT EXISTS ix_musicas_artista_titulo
+                ON musicas (artista_id, titulo)
+            ''')
+            self.cursor.execute('''
+                CREATE INDEX IF NOT EXISTS ix_musicas_genero_titulo
+                ON musicas (genero_id, titulo)
+            ''')
+
+            # Índices NOCASE para buscas por prefixo (LIKE 'termo%')
+            self.cursor.execute('''
+                CREATE INDEX IF NOT EXISTS ix_musicas_titulo_nocase
+                ON musicas (titulo COLLATE NOCASE)
+            ''')
+            self.cursor.execute('''
+                CREATE INDEX IF NOT EXISTS ix_artistas_nome_nocase
+                ON artistas (nome COLLATE NOCASE)
+            ''')
+
+            self._criar_fts()
+
             self.conexao.commit()
             print("Tabelas criadas com sucesso!")
         except sqlite3.Error as e:
@@ -70,9 +174,96 @@ class BancoDeDadosMusica:
             self.conexao.rollback()
             raise
 
+    def _criar_fts(self) -> None:
+        """
+        Cria a tabela virtual FTS5 que espelha título e nome do artista,
+        com triggers para mantê-la sincronizada. A busca por MATCH usa o
+        índice invertido em vez de varrer a tabela com LIKE '%termo%'.
+        """
+        try:
+            self.cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS musicas_fts
+                USING fts5(titulo, artista_nome)
+            ''')
+        except sqlite3.OperationalError:
+            # FTS5 não compilado nesta build do SQLite; buscar_musicas
+            # volta ao LIKE.
+            self._fts_disponivel = False
+            return
+        self._fts_disponivel = True
+
+        self.cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_musicas_fts_insert
+            AFTER INSERT ON musicas BEGIN
+                INSERT INTO musicas_fts (rowid, titulo, artista_nome)
+                VALUES (new.id, new.titulo,
+                        (SELECT nome FROM artistas WHERE id = new.artista_id));
+            END
+        ''')
+        self.cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_musicas_fts_delete
+            AFTER DELETE ON musicas BEGIN
+                DELETE FROM musicas_fts WHERE rowid = old.id;
+            END
+        ''')
+        self.cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_musicas_fts_update
+            AFTER UPDATE ON musicas BEGIN
+                UPDATE musicas_fts
+                SET titulo = new.titulo,
+                    artista_nome = (SELECT nome FROM artistas WHERE id = new.artista_id)
+                WHERE rowid = old.id;
+            END
+        ''')
+
+        # Popula de forma preguiçosa bancos criados antes do FTS existir
+        self.cursor.execute("SELECT COUNT(*) FROM musicas_fts")
+        if self.cursor.fetchone()[0] == 0:
+            self.cursor.execute('''
+                INSERT INTO musicas_fts (rowid, titulo, artista_nome)
+                SELECT m.id, m.titulo, a.nome
+                FROM musicas m JOIN artistas a ON m.artista_id = a.id
+            ''')
+
+    def _cursor_simples(self) -> sqlite3.Cursor:
+        """
+        Cursor sem a Row factory da conexão, para consultas escalares ou
+        de id: dispensa a construção do mapa de nomes por linha do
+        sqlite3.Row quando só os valores posicionais interessam.
+        """
+        cursor = self.conexao.cursor()
+        cursor.row_factory = None
+        return cursor
+
+    @contextmanager
+    def transacao(self):
+        """
+        Agrupa várias escritas em uma única transação.
+
+        Dentro do bloco, os métodos adicionar_* não confirmam
+        individualmente; há um único COMMIT (e um único fsync) no fim.
+        """
+        self._em_transacao = True
+        try:
+            with self.conexao:
+                yield
+        finally:
+            self._em_transacao = False
+
+    def _commit_se_autocommit(self) -> None:
+        """Confirma a escrita, exceto dentro de um bloco transacao()."""
+        if not self._em_transacao:
+            self.conexao.commit()
+
     def fechar(self) -> None:
         """Fecha a conexão com o banco de dados."""
         if self.conexao:
+            try:
+                # Atualiza estatísticas do planejador quando necessário,
+                # evitando varreduras completas nas buscas e JOINs futuros.
+                self.cursor.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
             self.conexao.close()
             print("Conexão com o banco de dados fechada.")
 
@@ -93,20 +284,22 @@ class BancoDeDadosMusica:
             nome (str): Nome do artista
 
         Returns:
-            Optional[int]: ID do artista criado ou None se falhar
+            Optional[int]: ID do artista criado (ou existente), None se falhar
         """
         try:
-            self.cursor.execute(
-                "INSERT INTO artistas (nome) VALUES (?)",
-                (nome,)
-            )
-            self.conexao.commit()
+            if _TEM_RETURNING:
+                self.cursor.execute(_SQL_UPSERT_ARTISTA, (nome,))
+                artista_id = self.cursor.fetchone()[0]
+                self._commit_se_autocommit()
+                return artista_id
+            self.cursor.execute(_SQL_ADD_ARTISTA, (nome,))
+            self._commit_se_autocommit()
             return self.cursor.lastrowid
         except sqlite3.IntegrityError:
             # Artista já existe
-            self.cursor.execute(
-                "SELECT id FROM artistas WHERE nome = ?", (nome,))
-            result = self.cursor.fetchone()
+            cursor = self._cursor_simples()
+            cursor.execute("SELECT id FROM artistas WHERE nome = ?", (nome,))
+            result = cursor.fetchone()
             return result[0] if result else None
         except sqlite3.Error as e:
             print(f"Erro ao adicionar artista: {e}")
@@ -151,16 +344,16 @@ class BancoDeDadosMusica:
             print(f"Erro ao buscar artista: {e}")
             return None
 
-    def obter_todos_artistas(self) -> List[Dict]:
+    def obter_todos_artistas(self) -> List[sqlite3.Row]:
         """
         Obtém todos os artistas.
 
         Returns:
-            List[Dict]: Lista de dicionários com dados dos artistas
+            List[sqlite3.Row]: Lista de linhas com dados dos artistas
         """
         try:
-            self.cursor.execute("SELECT * FROM artistas ORDER BY nome")
-            return [dict(row) for row in self.cursor.fetchall()]
+            self.cursor.execute(_SQL_TODOS_ARTISTAS)
+            return self.cursor.fetchall()
         except sqlite3.Error as e:
             print(f"Erro ao buscar artistas: {e}")
             return []
@@ -174,20 +367,22 @@ class BancoDeDadosMusica:
             nome (str): Nome do gênero
 
         Returns:
-            Optional[int]: ID do gênero criado ou None se falhar
+            Optional[int]: ID do gênero criado (ou existente), None se falhar
         """
         try:
-            self.cursor.execute(
-                "INSERT INTO generos (nome) VALUES (?)",
-                (nome,)
-            )
-            self.conexao.commit()
+            if _TEM_RETURNING:
+                self.cursor.execute(_SQL_UPSERT_GENERO, (nome,))
+                genero_id = self.cursor.fetchone()[0]
+                self._commit_se_autocommit()
+                return genero_id
+            self.cursor.execute(_SQL_ADD_GENERO, (nome,))
+            self._commit_se_autocommit()
             return self.cursor.lastrowid
         except sqlite3.IntegrityError:
             # Gênero já existe
-            self.cursor.execute(
-                "SELECT id FROM generos WHERE nome = ?", (nome,))
-            result = self.cursor.fetchone()
+            cursor = self._cursor_simples()
+            cursor.execute("SELECT id FROM generos WHERE nome = ?", (nome,))
+            result = cursor.fetchone()
             return result[0] if result else None
         except sqlite3.Error as e:
             print(f"Erro ao adicionar gênero: {e}")
@@ -232,16 +427,16 @@ class BancoDeDadosMusica:
             print(f"Erro ao buscar gênero: {e}")
             return None
 
-    def obter_todos_generos(self) -> List[Dict]:
+    def obter_todos_generos(self) -> List[sqlite3.Row]:
         """
         Obtém todos os gêneros.
 
         Returns:
-            List[Dict]: Lista de dicionários com dados dos gêneros
+            List[sqlite3.Row]: Lista de linhas com dados dos gêneros
         """
         try:
-            self.cursor.execute("SELECT * FROM generos ORDER BY nome")
-            return [dict(row) for row in self.cursor.fetchall()]
+            self.cursor.execute(_SQL_TODOS_GENEROS)
+            return self.cursor.fetchall()
         except sqlite3.Error as e:
             print(f"Erro ao buscar gêneros: {e}")
             return []
@@ -261,11 +456,9 @@ class BancoDeDadosMusica:
             Optional[int]: ID da música criada ou None se falhar
         """
         try:
-            self.cursor.execute('''
-                INSERT INTO musicas (artista_id, titulo, url, genero_id)
-                VALUES (?, ?, ?, ?)
-            ''', (artista_id, titulo, url, genero_id))
-            self.conexao.commit()
+            self.cursor.execute(
+                _SQL_ADD_MUSICA, (artista_id, titulo, url, genero_id))
+            self._commit_se_autocommit()
             return self.cursor.lastrowid
         except sqlite3.IntegrityError as e:
             print(f"Erro de integridade ao adicionar música: {e}")
@@ -276,6 +469,85 @@ class BancoDeDadosMusica:
             self.conexao.rollback()
             return None
 
+    def adicionar_musicas_bulk(self, rows: List[Tuple[str, str, str, str]]) -> int:
+        """
+        Adiciona várias músicas em uma única transação.
+
+        Resolve os nomes de artistas e gêneros em mapas de ids com
+        consultas IN em lotes, insere os nomes novos com executemany e
+        então insere todas as músicas de uma vez — um único COMMIT (e
+        fsync) para o lote inteiro, em vez de três por música.
+
+        Args:
+            rows: Sequência de tuplas (artista, titulo, url, genero)
+
+        Returns:
+            int: Quantidade de músicas inseridas (ignora URLs duplicadas)
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+
+        try:
+            with self.conexao:
+                artistas = self._resolver_nomes_bulk(
+                    'artistas', {r[0] for r in rows})
+                generos = self._resolver_nomes_bulk(
+                    'generos', {r[3] for r in rows})
+
+                # rowcount ignora as escritas feitas pelos triggers do FTS
+                self.cursor.executemany('''
+                    INSERT OR IGNORE INTO musicas (artista_id, titulo, url, genero_id)
+                    VALUES (?, ?, ?, ?)
+                ''', [
+                    (artistas[artista], titulo, url, generos[genero])
+                    for artista, titulo, url, genero in rows
+                ])
+                return self.cursor.rowcount
+        except sqlite3.Error as e:
+            print(f"Erro ao adicionar músicas em lote: {e}")
+            return 0
+
+    def _resolver_nomes_bulk(self, tabela: str, nomes: set) -> Dict[str, int]:
+        """
+        Resolve um conjunto de nomes em ids, inserindo os que faltam.
+
+        Consulta apenas os nomes recebidos, via IN com lotes de até
+        _MAX_VARIAVEIS parâmetros — duas consultas por lote em vez de
+        duas idas ao banco por nome.
+
+        Args:
+            tabela (str): 'artistas' ou 'generos'
+            nomes (set): Nomes a resolver
+
+        Returns:
+            Dict[str, int]: Mapa nome -> id
+        """
+        cursor = self._cursor_simples()
+        nomes = list(nomes)
+        mapa: Dict[str, int] = {}
+
+        def consultar(lote):
+            marcadores = ','.join('?' * len(lote))
+            cursor.execute(
+                f"SELECT nome, id FROM {tabela} WHERE nome IN ({marcadores})",
+                lote
+            )
+            mapa.update(cursor.fetchall())
+
+        for i in range(0, len(nomes), _MAX_VARIAVEIS):
+            consultar(nomes[i:i + _MAX_VARIAVEIS])
+
+        faltantes = [nome for nome in nomes if nome not in mapa]
+        if faltantes:
+            cursor.executemany(
+                f"INSERT OR IGNORE INTO {tabela} (nome) VALUES (?)",
+                [(nome,) for nome in faltantes]
+            )
+            for i in range(0, len(faltantes), _MAX_VARIAVEIS):
+                consultar(faltantes[i:i + _MAX_VARIAVEIS])
+        return mapa
+
     def obter_musica_por_id(self, musica_id: int) -> Optional[Dict]:
         """
         Obtém uma música pelo ID com informações do artista e gênero.
@@ -287,13 +559,7 @@ class BancoDeDadosMusica:
             Optional[Dict]: Dicionário com dados da música ou None
         """
         try:
-            self.cursor.execute('''
-                SELECT m.*, a.nome as artista_nome, g.nome as genero_nome
-                FROM musicas m
-                JOIN artistas a ON m.artista_id = a.id
-                JOIN generos g ON m.genero_id = g.id
-                WHERE m.id = ?
-            ''', (musica_id,))
+            self.cursor.execute(_SQL_MUSICA_POR_ID, (musica_id,))
             result = self.cursor.fetchone()
             return dict(result) if result else None
         except sqlite3.Error as e:
@@ -311,86 +577,76 @@ class BancoDeDadosMusica:
             Optional[Dict]: Dicionário com dados da música ou None
         """
         try:
-            self.cursor.execute('''
-                SELECT m.*, a.nome as artista_nome, g.nome as genero_nome
-                FROM musicas m
-                JOIN artistas a ON m.artista_id = a.id
-                JOIN generos g ON m.genero_id = g.id
-                WHERE m.url = ?
-            ''', (url,))
+            self.cursor.execute(_SQL_MUSICA_POR_URL, (url,))
             result = self.cursor.fetchone()
             return dict(result) if result else None
         except sqlite3.Error as e:
             print(f"Erro ao buscar música por URL: {e}")
             return None
 
-    def obter_musicas_por_artista(self, artista_id: int) -> List[Dict]:
+    def obter_musicas_por_artista(self, artista_id: int) -> Iterator[sqlite3.Row]:
         """
         Obtém todas as músicas de um artista específico.
 
         Args:
             artista_id (int): ID do artista
 
-        Returns:
-            List[Dict]: Lista de dicionários com dados das músicas
+        Yields:
+            sqlite3.Row: Linhas com dados das músicas, sob demanda
         """
         try:
-            self.cursor.execute('''
-                SELECT m.*, a.nome as artista_nome, g.nome as genero_nome
-                FROM musicas m
-                JOIN artistas a ON m.artista_id = a.id
-                JOIN generos g ON m.genero_id = g.id
-                WHERE m.artista_id = ?
-                ORDER BY m.titulo
-            ''', (artista_id,))
-            return [dict(row) for row in self.cursor.fetchall()]
+            # Cursor próprio: o iterador sobrevive a outras consultas
+            cursor = self.conexao.cursor()
+            cursor.execute(_SQL_MUSICAS_POR_ARTISTA, (artista_id,))
+            yield from cursor
         except sqlite3.Error as e:
             print(f"Erro ao buscar músicas por artista: {e}")
-            return []
 
-    def obter_musicas_por_genero(self, genero_id: int) -> List[Dict]:
+    def obter_musicas_por_genero(self, genero_id: int) -> Iterator[sqlite3.Row]:
         """
         Obtém todas as músicas de um gênero específico.
 
         Args:
             genero_id (int): ID do gênero
 
-        Returns:
-            List[Dict]: Lista de dicionários com dados das músicas
+        Yields:
+            sqlite3.Row: Linhas com dados das músicas, sob demanda
         """
         try:
-            self.cursor.execute('''
-                SELECT m.*, a.nome as artista_nome, g.nome as genero_nome
-                FROM musicas m
-                JOIN artistas a ON m.artista_id = a.id
-                JOIN generos g ON m.genero_id = g.id
-                WHERE m.genero_id = ?
-                ORDER BY m.titulo
-            ''', (genero_id,))
-            return [dict(row) for row in self.cursor.fetchall()]
+            cursor = self.conexao.cursor()
+            cursor.execute(_SQL_MUSICAS_POR_GENERO, (genero_id,))
+            yield from cursor
         except sqlite3.Error as e:
             print(f"Erro ao buscar músicas por gênero: {e}")
-            return []
 
-    def obter_todas_musicas(self) -> List[Dict]:
+    def obter_todas_musicas(self) -> Iterator[sqlite3.Row]:
         """
         Obtém todas as músicas com informações do artista e gênero.
 
-        Returns:
-            List[Dict]: Lista de dicionários com dados das músicas
+        Yields:
+            sqlite3.Row: Linhas com dados das músicas, sob demanda
         """
         try:
-            self.cursor.execute('''
-                SELECT m.*, a.nome as artista_nome, g.nome as genero_nome
-                FROM musicas m
-                JOIN artistas a ON m.artista_id = a.id
-                JOIN generos g ON m.genero_id = g.id
-                ORDER BY a.nome, m.titulo
-            ''')
-            return [dict(row) for row in self.cursor.fetchall()]
+            cursor = self.conexao.cursor()
+            cursor.execute(_SQL_TODAS_MUSICAS)
+            yield from cursor
         except sqlite3.Error as e:
             print(f"Erro ao buscar todas as músicas: {e}")
-            return []
+
+    def obter_todas_musicas_resumo(self) -> Iterator[sqlite3.Row]:
+        """
+        Obtém todas as músicas apenas com as colunas de exibição
+        (id, título, artista, gênero) — sem url nem ids de junção.
+
+        Yields:
+            sqlite3.Row: Linhas resumidas das músicas, sob demanda
+        """
+        try:
+            cursor = self.conexao.cursor()
+            cursor.execute(_SQL_TODAS_MUSICAS_RESUMO)
+            yield from cursor
+        except sqlite3.Error as e:
+            print(f"Erro ao buscar resumo das músicas: {e}")
 
     def atualizar_musica(self, musica_id: int, titulo: str = None, url: str = None,
                          artista_id: int = None, genero_id: int = None) -> bool:
@@ -463,18 +719,20 @@ class BancoDeDadosMusica:
         """
         Obtém estatísticas do banco de dados.
 
+        As três contagens saem em uma única consulta (subqueries
+        escalares), em vez de três execute/fetchone sequenciais.
+
         Returns:
             Dict[str, int]: Dicionário com contagens de artistas, gêneros e músicas
         """
         try:
-            self.cursor.execute("SELECT COUNT(*) as total FROM artistas")
-            artistas_count = self.cursor.fetchone()['total']
-
-            self.cursor.execute("SELECT COUNT(*) as total FROM generos")
-            generos_count = self.cursor.fetchone()['total']
-
-            self.cursor.execute("SELECT COUNT(*) as total FROM musicas")
-            musicas_count = self.cursor.fetchone()['total']
+            cursor = self._cursor_simples()
+            cursor.execute('''
+                SELECT (SELECT COUNT(*) FROM artistas),
+                       (SELECT COUNT(*) FROM generos),
+                       (SELECT COUNT(*) FROM musicas)
+            ''')
+            artistas_count, generos_count, musicas_count = cursor.fetchone()
 
             return {
                 'artistas': artistas_count,
@@ -485,26 +743,31 @@ class BancoDeDadosMusica:
             print(f"Erro ao obter estatísticas: {e}")
             return {'artistas': 0, 'generos': 0, 'musicas': 0}
 
-    def buscar_musicas(self, termo: str) -> List[Dict]:
+    def buscar_musicas(self, termo: str) -> Iterator[sqlite3.Row]:
         """
         Busca músicas por título ou nome do artista.
 
+        Usa o índice invertido FTS5 (com busca por prefixo) quando
+        disponível; caso contrário, cai no LIKE '%termo%' original.
+
         Args:
             termo (str): Termo de busca
 
-        Returns:
-            List[Dict]: Lista de músicas que correspondem à busca
+        Yields:
+            sqlite3.Row: Linhas das músicas que correspondem à busca
         """
         try:
-            self.cursor.execute('''
-                SELECT m.*, a.nome as artista_nome, g.nome as genero_nome
-                FROM musicas m
-                JOIN artistas a ON m.artista_id = a.id
-                JOIN generos g ON m.genero_id = g.id
-                WHERE m.titulo LIKE ? OR a.nome LIKE ?
-                ORDER BY a.nome, m.titulo
-            ''', (f'%{termo}%', f'%{termo}%'))
-            return [dict(row) for row in self.cursor.fetchall()]
+            cursor = self.conexao.cursor()
+            if self._fts_disponivel and termo.strip():
+                # Cada palavra vira uma busca de prefixo: 'ro' casa 'Rock';
+                # aspas internas são dobradas conforme a sintaxe do FTS5
+                match = ' '.join(
+                    '"{}"*'.format(palavra.replace('"', '""'))
+                    for palavra in termo.split()
+                )
+                cursor.execute(_SQL_BUSCA_FTS, (match,))
+            else:
+                cursor.execute(_SQL_BUSCA_LIKE, (f'%{termo}%', f'%{termo}%'))
+            yield from cursor
         except sqlite3.Error as e:
             print(f"Erro ao buscar músicas: {e}")
-            return []
@@ -1,11 +1,12 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional
 from Banco_Dados import BancoDeDadosMusica
-from tocador import tocar
-from random import shuffle
 
+# tocador (subprocess/socket) e random são importados dentro dos métodos
+# que os usam, para não pesar na partida de quem só lista ou consulta
 
-@dataclass
+
+@dataclass(slots=True)
 class Artista:
     id: int
     nome: str
@@ -14,7 +15,7 @@ class Artista:
         return self.nome
 
 
-@dataclass
+@dataclass(slots=True)
 class Genero:
     id: int
     nome: str
@@ -23,7 +24,19 @@ class Genero:
         return self.nome
 
 
-@dataclass
+@dataclass(slots=True)
+class MusicaResumo:
+    """Versão enxuta de Musica, só com as colunas de exibição"""
+    id: int
+    titulo: str
+    artista_nome: str
+    genero_nome: str
+
+    def __str__(self):
+        return f"{self.artista_nome or ''} - {self.titulo}"
+
+
+@dataclass(slots=True)
 class Musica:
     id: int
     titulo: str
@@ -32,14 +45,34 @@ class Musica:
     genero_id: int
     artista_nome: Optional[str] = None
     genero_nome: Optional[str] = None
+    # Rótulo de exibição montado uma única vez; __str__ roda em loop
+    # ao exibir a playlist
+    _label: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._label = f"{self.artista_nome or ''} - {self.titulo}"
+
+    @classmethod
+    def from_row(cls, row) -> "Musica":
+        """Cria uma Musica a partir de uma linha (sqlite3.Row) do banco"""
+        return cls(
+            id=row['id'],
+            titulo=row['titulo'],
+            url=row['url'],
+            artista_id=row['artista_id'],
+            genero_id=row['genero_id'],
+            artista_nome=row['artista_nome'],
+            genero_nome=row['genero_nome']
+        )
 
     def tocar(self, video=False, volume=80):
         """Comportamento da música"""
+        from tocador import tocar
         print(f"Tocando: {self.titulo}")
         tocar(link=self.url, video=video, volume=volume)
 
     def __str__(self):
-        return f"{self.artista_nome or ''} - {self.titulo}"
+        return self._label
 
 
 class CatalogoMusical:
@@ -48,15 +81,19 @@ class CatalogoMusical:
     def __init__(self):
         self.db = BancoDeDadosMusica("musicas.db")
         self._musicas = []
-        self._artistas = []
-        self._generos = []
+        # Caches de artistas/gêneros (None = ainda não carregado);
+        # invalidados sempre que um nome novo é gravado no banco
+        self._artistas_cache: Optional[List[Artista]] = None
+        self._generos_cache: Optional[List[Genero]] = None
 
     def adicionar_musica(self, titulo: str, url: str, artista: str, genero: str) -> Musica:
         """Adiciona uma nova música ao catálogo"""
-        artista_id = self.db.adicionar_artista(artista)
-        genero_id = self.db.adicionar_genero(genero)
-        musica_id = self.db.adicionar_musica(
-            artista_id, titulo, url, genero_id)
+        # Um único COMMIT para artista + gênero + música
+        with self.db.transacao():
+            artista_id = self._resolver_artista(artista)
+            genero_id = self._resolver_genero(genero)
+            musica_id = self.db.adicionar_musica(
+                artista_id, titulo, url, genero_id)
 
         musica = Musica(
             id=musica_id,
@@ -70,60 +107,64 @@ class CatalogoMusical:
         self._musicas.append(musica)
         return musica
 
+    def _resolver_artista(self, nome: str) -> int:
+        """Resolve o nome do artista em id, sem ir ao banco se estiver em cache"""
+        if self._artistas_cache is not None:
+            for artista in self._artistas_cache:
+                if artista.nome == nome:
+                    return artista.id
+        self._artistas_cache = None
+        return self.db.adicionar_artista(nome)
+
+    def _resolver_genero(self, nome: str) -> int:
+        """Resolve o nome do gênero em id, sem ir ao banco se estiver em cache"""
+        if self._generos_cache is not None:
+            for genero in self._generos_cache:
+                if genero.nome == nome:
+                    return genero.id
+        self._generos_cache = None
+        return self.db.adicionar_genero(nome)
+
+    def importar(self, musicas) -> int:
+        """Importa várias músicas de uma vez (artista, titulo, url, genero)"""
+        self._artistas_cache = None
+        self._generos_cache = None
+        return self.db.adicionar_musicas_bulk(musicas)
+
     def buscar_musicas(self) -> List[Musica]:
         """Retorna todas as músicas"""
-        dados = self.db.obter_todas_musicas()
-        return [
-            Musica(
-                id=m['id'],
-                titulo=m['titulo'],
-                url=m['url'],
-                artista_id=m['artista_id'],
-                genero_id=m['genero_id'],
-                artista_nome=m['artista_nome'],
-                genero_nome=m['genero_nome']
-            ) for m in dados
-        ]
+        return [Musica.from_row(m) for m in self.db.obter_todas_musicas()]
+
+    def listar_musicas_resumo(self) -> List[MusicaResumo]:
+        """Retorna todas as músicas só com os campos de exibição"""
+        return [MusicaResumo(*m)
+                for m in self.db.obter_todas_musicas_resumo()]
 
     def buscar_por_artista(self, artista_id: int) -> List[Musica]:
         """Busca músicas por artista"""
-        dados = self.db.obter_musicas_por_artista(artista_id)
-        return [
-            Musica(
-                id=m['id'],
-                titulo=m['titulo'],
-                url=m['url'],
-                artista_id=m['artista_id'],
-                genero_id=m['genero_id'],
-                artista_nome=m['artista_nome'],
-                genero_nome=m['genero_nome']
-            ) for m in dados
-        ]
+        return [Musica.from_row(m)
+                for m in self.db.obter_musicas_por_artista(artista_id)]
 
     def buscar_por_genero(self, genero_id: int) -> List[Musica]:
         """Busca músicas por gênero"""
-        dados = self.db.obter_musicas_por_genero(genero_id)
-        return [
-            Musica(
-                id=m['id'],
-                titulo=m['titulo'],
-                url=m['url'],
-                artista_id=m['artista_id'],
-                genero_id=m['genero_id'],
-                artista_nome=m['artista_nome'],
-                genero_nome=m['genero_nome']
-            ) for m in dados
-        ]
+        return [Musica.from_row(m)
+                for m in self.db.obter_musicas_por_genero(genero_id)]
 
     def listar_artistas(self) -> List[Artista]:
-        """Lista todos os artistas"""
-        dados = self.db.obter_todos_artistas()
-        return [Artista(id=a['id'], nome=a['nome']) for a in dados]
+        """Lista todos os artistas (cacheado até um artista novo ser gravado)"""
+        if self._artistas_cache is None:
+            dados = self.db.obter_todos_artistas()
+            self._artistas_cache = [
+                Artista(id=a['id'], nome=a['nome']) for a in dados]
+        return self._artistas_cache
 
     def listar_generos(self) -> List[Genero]:
-        """Lista todos os gêneros"""
-        dados = self.db.obter_todos_generos()
-        return [Genero(id=g['id'], nome=g['nome']) for g in dados]
+        """Lista todos os gêneros (cacheado até um gênero novo ser gravado)"""
+        if self._generos_cache is None:
+            dados = self.db.obter_todos_generos()
+            self._generos_cache = [
+                Genero(id=g['id'], nome=g['nome']) for g in dados]
+        return self._generos_cache
 
     def estatisticas(self) -> dict:
         """Retorna estatísticas do catálogo"""
@@ -141,6 +182,10 @@ class Player:
         self.video = False
         self.volume = 80
         self._playlist_atual = []
+        # Um único mpv ocioso recebe as faixas via IPC, sem um processo
+        # novo (e novo buffer de rede) por música; criado na primeira
+        # reprodução para não atrasar a partida
+        self._servidor = None
 
     def criar_playlist(self, musicas: List[Musica]):
         """Cria uma nova playlist"""
@@ -159,16 +204,34 @@ class Player:
             return
 
         self.exibir_playlist()
+        if self._servidor is None:
+            from tocador import ServidorMPV
+            self._servidor = ServidorMPV(video=self.video, volume=self.volume)
+        if self._servidor.iniciar():
+            # A primeira faixa substitui a fila anterior; as demais são
+            # enfileiradas e o mpv as encadeia sem pausa entre elas
+            for i, musica in enumerate(self._playlist_atual):
+                self._servidor.enfileirar(musica.url, substituir=(i == 0))
+            return
+
+        # Sem servidor mpv disponível: reproduz faixa a faixa
         for musica in self._playlist_atual:
             musica.tocar(video=self.video, volume=self.volume)
 
     def tocar_musicas(self, musicas: List[Musica], aleatorio: bool):
         """Toca uma lista de músicas"""
-        if aleatorio:
-            shuffle(musicas)
-        self.criar_playlist(musicas)
+        from random import sample
+        # Embaralha uma cópia para não corromper a lista do chamador
+        # (que pode estar em cache)
+        playlist = sample(musicas, len(musicas)) if aleatorio else musicas
+        self.criar_playlist(playlist)
         self.tocar_playlist()
 
+    def fechar(self):
+        """Encerra o servidor mpv, se chegou a ser criado"""
+        if self._servidor is not None:
+            self._servidor.encerrar()
+
 
 class ServicoMusical:
     """Orquestra os serviços musicais"""
@@ -198,6 +261,7 @@ class ServicoMusical:
 
     def fechar(self):
         """Fecha todos os recursos"""
+        self.player.fechar()
         self.catalogo.fechar()
 
 
@@ -280,7 +344,7 @@ class InterfaceUsuario:
 
     def listar_musicas(self):
         """Lista todas as músicas"""
-        musicas = self.servico.catalogo.buscar_musicas()
+        musicas = self.servico.catalogo.listar_musicas_resumo()
         print("\n📋 TODAS AS MÚSICAS")
         print("-"*50)
         for musica in musicas:
@@ -1,4 +1,89 @@
+import json
+import os
+import socket
 import subprocess
+import time
+
+
+class ServidorMPV:
+    """
+    Mantém um único processo mpv vivo (--idle) e envia as URLs pelo
+    socket IPC, em vez de criar um processo novo por faixa. Elimina o
+    custo de fork + inicialização do mpv entre as músicas e permite
+    enfileirar a playlist inteira de uma vez.
+    """
+
+    def __init__(self, video=False, volume=80):
+        self.video = video
+        self.volume = volume
+        self.processo = None
+        self._socket_path = f"/tmp/catalogo-musical-mpv-{os.getpid()}.sock"
+
+    def iniciar(self) -> bool:
+        """Sobe o mpv ocioso se ainda não estiver rodando."""
+        if self.processo and self.processo.poll() is None:
+            return True
+
+        command = [
+            'mpv',
+            '--idle',
+            f'--input-ipc-server={self._socket_path}',
+            '--really-quiet',
+            f'--volume={self.volume}',
+        ]
+        if not self.video:
+            command.append('--no-video')
+
+        try:
+            self.processo = subprocess.Popen(
+                command,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        except FileNotFoundError:
+            print("Comando mpv não encontrado. Verifique se está instalado.")
+            return False
+
+        # Aguarda o mpv criar o socket IPC
+        for _ in range(50):
+            if os.path.exists(self._socket_path):
+                return True
+            if self.processo.poll() is not None:
+                return False
+            time.sleep(0.1)
+        return False
+
+    def enfileirar(self, link, substituir=False) -> bool:
+        """
+        Envia uma URL à fila de reprodução do mpv.
+
+        Com substituir=True a fila atual é descartada e a URL toca
+        imediatamente — usado na primeira faixa de cada playlist, para
+        uma nova seleção não ficar esperando a anterior terminar.
+        """
+        modo = "replace" if substituir else "append-play"
+        comando = json.dumps({"command": ["loadfile", link, modo]}) + "\n"
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(self._socket_path)
+                sock.sendall(comando.encode())
+            return True
+        except OSError as e:
+            print(f"Erro ao enviar música ao mpv: {e}")
+            return False
+
+    def encerrar(self) -> None:
+        """Encerra o processo mpv e remove o socket."""
+        if self.processo and self.processo.poll() is None:
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                    sock.connect(self._socket_path)
+                    sock.sendall(b'{"command": ["quit"]}\n')
+                self.processo.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                self.processo.terminate()
+        if os.path.exists(self._socket_path):
+            os.remove(self._socket_path)
 
 
 def tocar(link, video=False, volume=80):
@@ -9,19 +94,21 @@ def tocar(link, video=False, volume=80):
     command = [
         'mpv',
         imagem,
+        '--really-quiet',
         f'--volume={volume}',
         link
     ]
 
     try:
-        result = subprocess.run(
+        # Descarta o stdout do mpv em vez de acumulá-lo em memória
+        # durante toda a reprodução; só o stderr é capturado para erros
+        subprocess.run(
             command,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             check=True
         )
-        # print("Comando executado com sucesso")
-        result.stdout
 
     except subprocess.CalledProcessError as e:
         print(f"Erro ao executar comando: {e}")